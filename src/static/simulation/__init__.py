@@ -9,7 +9,7 @@ from . import geometry
 from .component import Component
 from .robot import RobotMeasurements, Robot
 from . import shapes
-from .shapes import Shape
+from .shapes import Shape, Style
 
 
 @dataclass
@@ -42,28 +42,35 @@ class Simulation(Component):
         self._parameters = parameters
         self._robot_speed: float = 0
         self._robot_turning_speed: float = 0
-        self._odometry = Odometry(
+        odometry = self._odometry = Odometry(
             translation_x=0,
             translation_y=0,
-            rotation=math.pi,
+            rotation=-math.pi,
         )
+        # Place the robot where the odometry says it is, so that steps without motion have nothing to update
+        self._robot.set_pose(geometry.Vector2d(odometry.translation_x, odometry.translation_y), odometry.rotation)
 
     def move_forward_in_time(self, change_in_time: float) -> Simulation:
         if change_in_time < 0:
             raise _BelowLowerBound
 
+        # A robot that is neither driving nor steering stays where it is
+        if self._robot_speed == 0 and self._robot_turning_speed == 0:
+            return self
+
+        robot = self._robot
+
         self.set_bounded_robot_steering_angle(
-            self.robot_steering_angle + self.robot_turning_speed * change_in_time
+            robot.steering_angle + self._robot_turning_speed * change_in_time
         )
-        self._odometry = calculate_next_odometry(
+        odometry = self._odometry = calculate_next_odometry(
             self._odometry,
             time_elapsed_since_last_odometry_measurement=change_in_time,
-            speed=self.robot_speed,
+            speed=self._robot_speed,
             wheel_base=self._parameters.robot_measurements.wheel_base,
-            steering_angle=self.robot_steering_angle
+            steering_angle=robot.steering_angle
         )
-        self._robot.translation = geometry.Vector2d(self._odometry.translation_x, self._odometry.translation_y)
-        self._robot.rotation = self._odometry.rotation
+        robot.set_pose(geometry.Vector2d(odometry.translation_x, odometry.translation_y), odometry.rotation)
 
         return self
 
@@ -122,32 +129,35 @@ class Simulation(Component):
         return self
 
     def set_bounded_robot_speed(self, unbounded_speed: float) -> Simulation:
-        try:
-            self.robot_speed = unbounded_speed
-        except _BelowLowerBound:
-            self.robot_speed = self._parameters.min_robot_speed
-        except _AboveUpperBound:
-            self._robot_speed = self._parameters.max_robot_speed
+        min_speed = self._parameters.min_robot_speed
+        max_speed = self._parameters.max_robot_speed
+
+        self.robot_speed = (
+            min_speed if unbounded_speed < min_speed else max_speed if unbounded_speed > max_speed else unbounded_speed
+        )
 
         return self
 
     def set_bounded_robot_steering_angle(self, unbounded_angle: float) -> Simulation:
-        try:
-            self.robot_steering_angle = unbounded_angle
-        except _BelowLowerBound:
-            self.robot_steering_angle = self._parameters.min_robot_steering_angle
-        except _AboveUpperBound:
-            self.robot_steering_angle = self._parameters.max_robot_steering_angle
+        min_angle = self._parameters.min_robot_steering_angle
+        max_angle = self._parameters.max_robot_steering_angle
+
+        # Clamp up front instead of letting the setter raise, this runs on every step while turning
+        self.robot_steering_angle = (
+            min_angle if unbounded_angle < min_angle else max_angle if unbounded_angle > max_angle else unbounded_angle
+        )
 
         return self
 
     def set_bounded_robot_turning_speed(self, unbounded_change_in_angle_per_unit_time: float) -> Simulation:
-        try:
-            self._robot_turning_speed = unbounded_change_in_angle_per_unit_time
-        except _BelowLowerBound:
-            self._robot_turning_speed = self._parameters.min_robot_turning_speed
-        except _AboveUpperBound:
-            self._robot_turning_speed = self._parameters.max_robot_turning_speed
+        min_turning_speed = self._parameters.min_robot_turning_speed
+        max_turning_speed = self._parameters.max_robot_turning_speed
+
+        self.robot_turning_speed = (
+            min_turning_speed if unbounded_change_in_angle_per_unit_time < min_turning_speed
+            else max_turning_speed if unbounded_change_in_angle_per_unit_time > max_turning_speed
+            else unbounded_change_in_angle_per_unit_time
+        )
 
         return self
 
@@ -1,20 +1,33 @@
 import math
 import sys
 from dataclasses import dataclass
+from typing import TypeVar
 
-from . import geometry
+import numpy as np
 
 
 _LARGE_VALUE = sys.float_info.max
 
+_FULL_TURN = 2 * math.pi
+
+_ARotation = TypeVar("_ARotation", float, np.ndarray)
+
 
 @dataclass
 class Odometry:
     translation_x: float
     translation_y: float
+    # Kept within [-pi, pi) so that it doesn't lose precision as it accumulates
     rotation: float
 
 
+@dataclass
+class OdometryTrajectory:
+    translation_x: np.ndarray
+    translation_y: np.ndarray
+    rotation: np.ndarray
+
+
 def calculate_next_odometry(
         last_odometry: Odometry,
         *,
@@ -25,19 +38,73 @@ def calculate_next_odometry(
 ) -> Odometry:
     turning_radius = wheel_base / math.sin(steering_angle) if steering_angle != 0 else _LARGE_VALUE
     change_in_rotation = speed * time_elapsed_since_last_odometry_measurement / turning_radius
-    change_in_position_relative_to_robot = geometry.Vector2d(
-        turning_radius * (1 - math.cos(change_in_rotation)),
-        turning_radius * math.sin(change_in_rotation)
+    change_in_x_relative_to_robot = turning_radius * (1 - math.cos(change_in_rotation))
+    change_in_y_relative_to_robot = turning_radius * math.sin(change_in_rotation)
+
+    # Rotate the change by the robot's heading in closed form rather than through an affine transformation
+    cos_rotation = math.cos(last_odometry.rotation)
+    sin_rotation = math.sin(last_odometry.rotation)
+
+    odom = Odometry(
+        translation_x=(
+            last_odometry.translation_x
+            + cos_rotation * change_in_x_relative_to_robot
+            - sin_rotation * change_in_y_relative_to_robot
+        ),
+        translation_y=(
+            last_odometry.translation_y
+            + sin_rotation * change_in_x_relative_to_robot
+            + cos_rotation * change_in_y_relative_to_robot
+        ),
+        rotation=_normalize_rotation(last_odometry.rotation + change_in_rotation),
     )
-    change_in_position = geometry.transform(
-        change_in_position_relative_to_robot,
-        geometry.rotate(last_odometry.rotation)
+
+    return odom
+
+
+def calculate_odometry_trajectory(
+        initial_odometry: Odometry,
+        *,
+        times_elapsed_between_odometry_measurements: np.ndarray | float,
+        speeds: np.ndarray | float,
+        wheel_base: float,
+        steering_angles: np.ndarray | float,
+) -> OdometryTrajectory:
+    time_elapsed, speed, steering_angle = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(times_elapsed_between_odometry_measurements, dtype=np.float64)),
+        np.asarray(speeds, dtype=np.float64),
+        np.asarray(steering_angles, dtype=np.float64),
     )
+    distance = speed * time_elapsed
+    sin_steering_angle = np.sin(steering_angle)
+    is_turning = steering_angle != 0
 
-    odom = Odometry(
-        translation_x=last_odometry.translation_x + change_in_position.x,
-        translation_y=last_odometry.translation_y + change_in_position.y,
-        rotation=last_odometry.rotation + change_in_rotation,
+    # Straight steps have an infinite turning radius, substitute a finite one and fix their results up below
+    turning_radius = wheel_base / np.where(is_turning, sin_steering_angle, 1)
+    change_in_rotation = distance * sin_steering_angle / wheel_base
+    change_in_x_relative_to_robot = np.where(is_turning, turning_radius * (1 - np.cos(change_in_rotation)), 0)
+    change_in_y_relative_to_robot = np.where(is_turning, turning_radius * np.sin(change_in_rotation), distance)
+
+    # Accumulate step by step, starting from the initial values, so that the sums match calculate_next_odometry
+    rotation = np.cumsum(np.concatenate(([initial_odometry.rotation], change_in_rotation)))
+    cos_rotation = np.cos(rotation[:-1])
+    sin_rotation = np.sin(rotation[:-1])
+
+    translation_x = np.cumsum(np.concatenate((
+        [initial_odometry.translation_x],
+        cos_rotation * change_in_x_relative_to_robot - sin_rotation * change_in_y_relative_to_robot,
+    )))
+    translation_y = np.cumsum(np.concatenate((
+        [initial_odometry.translation_y],
+        sin_rotation * change_in_x_relative_to_robot + cos_rotation * change_in_y_relative_to_robot,
+    )))
+
+    return OdometryTrajectory(
+        translation_x=translation_x[1:],
+        translation_y=translation_y[1:],
+        rotation=_normalize_rotation(rotation[1:]),
     )
 
-    return odom
\ No newline at end of file
+
+def _normalize_rotation(rotation: _ARotation) -> _ARotation:
+    return (rotation + math.pi) % _FULL_TURN - math.pi
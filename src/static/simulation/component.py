@@ -7,12 +7,21 @@ from . import geometry
 from .shapes import Shape
 
 
+# The parent of every root component, shared so that the world transformation caches can hit at the root as well
+_IDENTITY = geometry.AffineTransformation()
+
+
 @dataclass(init=False)
 class Component:
     name: str
     transformation: geometry.AffineTransformation
     _shapes: dict[str, Shape]
     _children: dict[str, Component]
+    _world_transformation_cache: tuple[
+        geometry.AffineTransformation,
+        geometry.AffineTransformation,
+        geometry.AffineTransformation,
+    ] | None
 
     def __init__(
             self,
@@ -25,6 +34,7 @@ class Component:
         self.transformation = geometry.AffineTransformation()
         self._shapes = {}
         self._children = {}
+        self._world_transformation_cache = None
 
         for shape_name, shape in shapes.items():
             self.add_shape(**{shape_name: shape})
@@ -104,9 +114,35 @@ class Component:
         return self._children.values()
 
     def shapes_in_world_coordinates(self) -> Iterable[Shape]:
+        for shape, transformation in self.shapes_with_world_transformations():
+            yield geometry.transform(shape, transformation)
+
+    def shapes_with_world_transformations(self) -> Iterable[tuple[Shape, geometry.AffineTransformation]]:
+        return self._shapes_with_transformations_in(_IDENTITY)
+
+    def _shapes_with_transformations_in(
+            self,
+            parent_transformation: geometry.AffineTransformation,
+    ) -> Iterable[tuple[Shape, geometry.AffineTransformation]]:
+        # Compose the transformations down the tree so that every shape is only transformed once
+        transformation = self._world_transformation_in(parent_transformation)
+
         for shape in self._shapes.values():
-            yield geometry.transform(shape, self.transformation)
+            yield shape, transformation
 
         for child in self.iter_children():
-            for shape in child.shapes_in_world_coordinates():
-                yield geometry.transform(shape, self.transformation)
+            yield from child._shapes_with_transformations_in(transformation)
+
+    def _world_transformation_in(
+            self,
+            parent_transformation: geometry.AffineTransformation,
+    ) -> geometry.AffineTransformation:
+        # The composition only has to be redone when either side has been replaced since the last frame
+        cache = self._world_transformation_cache
+        if cache is not None and cache[0] is parent_transformation and cache[1] is self.transformation:
+            return cache[2]
+
+        transformation = self.transformation.transform(parent_transformation)
+        self._world_transformation_cache = (parent_transformation, self.transformation, transformation)
+
+        return transformation
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import abc
+import functools
 import math
 from abc import ABC
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from math import cos as _cos, sin as _sin
 from typing import Any, overload, Iterator, Literal, NoReturn, Protocol, TypeVar
 
+import numpy as np
+
 
 _TranslationDirection = Literal[
     "left-then-forward" , "<^",
@@ -27,6 +31,60 @@ _ScaleDirection = Literal[
 ]
 
 
+# Each direction maps to the signs that turn it into a plain right-then-forward translation
+_TRANSLATION_DIRECTION_SIGNS: dict[str, tuple[int, int]] = {
+    "right-then-forward": ( 1,  1), ">^": ( 1,  1),
+    "left-then-forward" : (-1,  1), "<^": (-1,  1),
+    "left-then-down"    : (-1, -1), "<v": (-1, -1),
+    "right-then-down"   : ( 1, -1), ">v": ( 1, -1),
+}
+
+_ROTATION_DIRECTION_SIGNS: dict[str, int] = {
+    "counterclockwise":  1, "<-.":  1,
+    "clockwise"       : -1, ".->": -1,
+}
+
+_ENLARGE, _SHRINK = range(2)
+
+_SCALE_DIRECTIONS: dict[str, int] = {
+    "enlarge": _ENLARGE, "<>": _ENLARGE,
+    "shrink" : _SHRINK , "><": _SHRINK ,
+}
+
+
+_QUARTER_TURN_COS_SIN: dict[float, tuple[float, float]] = {
+    0.0             : ( 1.0,  0.0),
+    math.pi / 2     : ( 0.0,  1.0),
+    math.pi         : (-1.0,  0.0),
+    3 * math.pi / 2 : ( 0.0, -1.0),
+    -math.pi / 2    : ( 0.0, -1.0),
+    -math.pi        : (-1.0,  0.0),
+}
+
+_IDENTITY_ROWS = [
+    [1.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0],
+    [0.0, 0.0, 1.0],
+]
+
+_COS_SIN_CACHE_SIZE = 256
+
+_cos_sin_cache: dict[float, tuple[float, float]] = dict(_QUARTER_TURN_COS_SIN)
+
+
+def _cos_sin(angle: float) -> tuple[float, float]:
+    cos_sin = _cos_sin_cache.get(angle)
+
+    if cos_sin is None:
+        if len(_cos_sin_cache) >= _COS_SIN_CACHE_SIZE:
+            _cos_sin_cache.clear()
+            _cos_sin_cache.update(_QUARTER_TURN_COS_SIN)
+
+        cos_sin = _cos_sin_cache[angle] = (_cos(angle), _sin(angle))
+
+    return cos_sin
+
+
 def vector(x: float, y: float) -> Vector2d:
     return Vector2d(x, y)
 
@@ -40,9 +98,15 @@ def transform(x: float, y: float, transformation: Transformation) -> Vector2d: .
 
 
 def transform(*args: float | Transformable | Transformation) -> Transformable:
-    *args, transformation = args
-    transformable = _args_to_transformable(*args)
-    return transformation.__apply_transform_to__(transformable)
+    if len(args) == 2:
+        transformable, transformation = args
+        return transformation.__apply_transform_to__(transformable)
+
+    x, y, transformation = args
+    if type(transformation) is AffineTransformation:
+        return transformation._apply_xy(x, y)
+
+    return transformation.__apply_transform_to__(Vector2d(x, y))
 
 
 @overload
@@ -54,18 +118,15 @@ def undo_transform(x: float, y: float, transformation: Transformation) -> Vector
 
 
 def undo_transform(*args: float | Transformable | Transformation) -> Transformable:
-    *args, transformation = args
-    transformable = _args_to_transformable(*args)
-    return transformation.__remove_transform_from__(transformable)
-
+    if len(args) == 2:
+        transformable, transformation = args
+        return transformation.__remove_transform_from__(transformable)
 
-def _args_to_transformable(*args: float | Transformable) -> Transformable:
-    if len(args) == 1:
-        return args[0]
-    else:
-        x, y = args
+    x, y, transformation = args
+    if type(transformation) is AffineTransformation:
+        return transformation._remove_xy(x, y)
 
-        return Vector2d(x, y)
+    return transformation.__remove_transform_from__(Vector2d(x, y))
 
 
 @overload
@@ -97,6 +158,11 @@ def rotate(angle: float, direction: _RotationDirection) -> AffineTransformation:
 
 
 def rotate(*args: float | _RotationDirection) -> AffineTransformation:
+    return _cached_rotation(*args)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_rotation(*args: float | _RotationDirection) -> AffineTransformation:
     return AffineTransformation().rotate(*args)
 
 
@@ -137,25 +203,55 @@ class Transformation(Protocol):
 
 @dataclass(init=False)
 class AffineTransformation(Transformation):
+    # Transformations are immutable: every operation returns a new one and matrices are read-only. So the inverse,
+    # the coefficients and compositions such as components' world transformations can be cached and shared
     matrix: Matrix3x3
+    _inverse_matrix: Matrix3x3 | None = field(repr=False, compare=False)
+    _is_identity: bool = field(repr=False, compare=False)
+    _affine_coefficients: tuple[float, float, float, float, float, float] | None = field(repr=False, compare=False)
 
     @classmethod
     def _from_matrix(cls, matrix: Matrix3x3) -> AffineTransformation:
-        inst = cls()
+        inst = cls.__new__(cls)
 
         inst.matrix = matrix
+        inst._inverse_matrix = None
+        inst._is_identity = matrix._matrix.tolist() == _IDENTITY_ROWS
+        inst._affine_coefficients = None
+
+        return inst
+
+    @classmethod
+    def _from_rows(
+            cls,
+            row1: tuple[float, float, float],
+            row2: tuple[float, float, float],
+            row3: tuple[float, float, float],
+            /,
+    ) -> AffineTransformation:
+        inst = cls.__new__(cls)
+
+        inst.matrix = Matrix3x3._from_rows(row1, row2, row3)
+        inst._inverse_matrix = None
+        inst._is_identity = (row1, row2, row3) == ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+        inst._affine_coefficients = None
 
         return inst
 
     def __init__(self):
-        self.matrix = Matrix3x3(
-            (1, 0, 0),
-            (0, 1, 0),
-            (0, 0, 1),
-        )
+        self.matrix = _IDENTITY_MATRIX
+        self._inverse_matrix = None
+        self._is_identity = True
+        self._affine_coefficients = None
 
     def transform(self, transformation: AffineTransformation) -> AffineTransformation:
-        return self._from_matrix(transformation.matrix * self.matrix)
+        if self._is_identity:
+            return transformation
+
+        if transformation._is_identity:
+            return self
+
+        return self._from_matrix(Matrix3x3._from_array(transformation.matrix._matrix.dot(self.matrix._matrix)))
 
     @overload
     def translate(self, vector: Vector2d) -> AffineTransformation: ...
@@ -171,9 +267,10 @@ class AffineTransformation(Transformation):
 
     def translate(self, *args: float | Vector2d | _TranslationDirection) -> AffineTransformation:
         if type(args[-1]) is str:
-            *args, direction = args
+            sign_x, sign_y = _TRANSLATION_DIRECTION_SIGNS[args[-1]]
+            args = args[:-1]
         else:
-            direction = "right-then-up"
+            sign_x = sign_y = 1
 
         if len(args) == 1:
             translation_vector = args[0]
@@ -181,20 +278,21 @@ class AffineTransformation(Transformation):
         else:
             x, y = args
 
-        if direction == "left-then-up" or direction == "<^":
-            return self.translate(-x, y)
+        return self._translate_xy(sign_x * x, sign_y * y)
 
-        if direction == "left-then-down" or direction == "<v":
-            return self.translate(-x, -y)
+    def _translate_xy(self, x: float, y: float) -> AffineTransformation:
+        # Starting from the identity, the result is just the translation matrix
+        if self._is_identity:
+            return self._from_rows((1.0, 0.0, x), (0.0, 1.0, y), (0.0, 0.0, 1.0))
 
-        if direction == "right-then-down" or direction == ">v":
-            return self.translate(x, -y)
+        (a, b, c), (d, e, f), (g, h, i) = self.matrix._matrix.tolist()
 
-        return self._from_matrix(Matrix3x3(
-            (1, 0, x),
-            (0, 1, y),
-            (0, 0, 1)
-        ) * self.matrix)
+        # Left-multiplication by the translation matrix only adds multiples of the last row
+        return self._from_rows(
+            (a + x * g, b + x * h, c + x * i),
+            (d + y * g, e + y * h, f + y * i),
+            (g        , h        , i        ),
+        )
 
     @overload
     def rotate(self, angle: float) -> AffineTransformation: ...
@@ -203,21 +301,25 @@ class AffineTransformation(Transformation):
     def rotate(self, angle: float, direction: _RotationDirection) -> AffineTransformation: ...
 
     def rotate(self, *args) -> AffineTransformation:
-        if type(args[-1]) is str:
-            *args, direction = args
-        else:
-            direction = "counterclockwise"
+        if len(args) == 2:
+            return self._rotate(_ROTATION_DIRECTION_SIGNS[args[1]] * args[0])
+
+        return self._rotate(args[0])
 
-        angle = args[0]
+    def _rotate(self, angle: float) -> AffineTransformation:
+        cos_angle, sin_angle = _cos_sin(angle)
 
-        if direction == "clockwise" or direction == ".->":
-            return self.rotate(-angle)
+        if self._is_identity:
+            return self._from_rows((cos_angle, -sin_angle, 0.0), (sin_angle, cos_angle, 0.0), (0.0, 0.0, 1.0))
 
-        return self._from_matrix(Matrix3x3(
-            (math.cos(angle), -math.sin(angle), 0),
-            (math.sin(angle),  math.cos(angle), 0),
-            (0              ,  0              , 1),
-        ) * self.matrix)
+        (a, b, c), (d, e, f), (g, h, i) = self.matrix._matrix.tolist()
+
+        # Left-multiplication by the rotation matrix only mixes the first two rows
+        return self._from_rows(
+            (cos_angle * a - sin_angle * d, cos_angle * b - sin_angle * e, cos_angle * c - sin_angle * f),
+            (sin_angle * a + cos_angle * d, sin_angle * b + cos_angle * e, sin_angle * c + cos_angle * f),
+            (g                            , h                            , i                            ),
+        )
 
     @overload
     def scale(self, vector: Vector2d) -> AffineTransformation: ...
@@ -239,70 +341,153 @@ class AffineTransformation(Transformation):
 
     def scale(self, *args: float | Vector2d | _ScaleDirection) -> AffineTransformation:
         if type(args[-1]) is str:
-            *args, direction = args
+            direction = _SCALE_DIRECTIONS[args[-1]]
+            args = args[:-1]
         else:
-            direction: _ScaleDirection = "enlarge"
+            direction = _ENLARGE
 
         if len(args) == 1:
             arg = args[0]
 
-            if isinstance(arg, Vector2d):
+            if type(arg) is Vector2d:
                 x, y = arg.x, arg.y
             else:
                 x = y = arg
         else:
             x, y = args
 
-        if direction == "shrink" or direction == "><":
-            x, y = 1 / x, 1 / y
+        if direction == _SHRINK:
+            return self._scale_xy(1 / x, 1 / y)
+
+        return self._scale_xy(x, y)
+
+    def _scale_xy(self, x: float, y: float) -> AffineTransformation:
+        if self._is_identity:
+            return self._from_rows((x, 0.0, 0.0), (0.0, y, 0.0), (0.0, 0.0, 1.0))
+
+        (a, b, c), (d, e, f), (g, h, i) = self.matrix._matrix.tolist()
+
+        # Left-multiplication by the scaling matrix only scales the first two rows
+        return self._from_rows(
+            (x * a, x * b, x * c),
+            (y * d, y * e, y * f),
+            (g    , h    , i    ),
+        )
 
-        return self._from_matrix(Matrix3x3(
-            (x, 0, 0),
-            (0, y, 0),
-            (0, 0, 1),
-        ) * self.matrix)
+    def as_coefficients(self) -> tuple[float, float, float, float, float, float]:
+        a, c, e, b, d, f = self._get_affine_coefficients()
+
+        # Same (a, b, c, d, e, f) order as canvas setTransform and SVG matrix()
+        return a, b, c, d, e, f
 
     def invert(self) -> AffineTransformation:
-        return self._from_matrix(self.matrix ** -1)
+        inverse = self._from_matrix(self._get_inverse_matrix())
+        inverse._inverse_matrix = self.matrix
 
-    def __apply_transform_to__(self, transformable: _ATransformable) -> _ATransformable:
+        return inverse
 
-        def transform_vector(vector: Vector2d) -> Vector2d:
-            vector3d = Vector3d(vector.x, vector.y, 1)
+    def apply_many(self, points: np.ndarray) -> np.ndarray:
+        return _apply_matrix_to_points(self.matrix._matrix, points)
 
-            transformed_vector3d = self.matrix * vector3d
+    def undo_many(self, points: np.ndarray) -> np.ndarray:
+        # Reuse the cached inverse instead of solving the system again for every batch
+        return _apply_matrix_to_points(self._get_inverse_matrix()._matrix, points)
 
-            return Vector2d(
-                transformed_vector3d.x,
-                transformed_vector3d.y,
-            )
+    def _apply_xy(self, x: float, y: float) -> Vector2d:
+        if self._is_identity:
+            return Vector2d(x, y)
 
-        return transformable.__from_vectors__(
-            transform_vector(vector)
-            for vector in transformable.__as_vectors__()
-        )
+        a, b, c, d, e, f = self._get_affine_coefficients()
+
+        return Vector2d._from_floats(a * x + b * y + c, d * x + e * y + f)
+
+    def _remove_xy(self, x: float, y: float) -> Vector2d:
+        if self._is_identity:
+            return Vector2d(x, y)
+
+        a, b, c, d, e, f = _affine_coefficients_of(self._get_inverse_matrix())
+
+        return Vector2d._from_floats(a * x + b * y + c, d * x + e * y + f)
+
+    def __apply_transform_to__(self, transformable: _ATransformable) -> _ATransformable:
+        if self._is_identity:
+            return _copy_transformable(transformable)
+
+        return _transform_vectors(self._get_affine_coefficients(), transformable)
 
     def __remove_transform_from__(self, transformable: _ATransformable) -> _ATransformable:
+        if self._is_identity:
+            return _copy_transformable(transformable)
 
-        inverse_matrix = self.matrix**-1
+        return _transform_vectors(_affine_coefficients_of(self._get_inverse_matrix()), transformable)
 
-        def inverse_transform_vector(vector: Vector2d) -> Vector2d:
-            vector3d = Vector3d(vector.x, vector.y, 1)
+    def _get_inverse_matrix(self) -> Matrix3x3:
+        if self._inverse_matrix is None:
+            self._inverse_matrix = self.matrix.__inverse__()
 
-            transformed_vector3d = inverse_matrix * vector3d
+        return self._inverse_matrix
 
-            return Vector2d(
-                transformed_vector3d.x,
-                transformed_vector3d.y,
-            )
+    def _get_affine_coefficients(self) -> tuple[float, float, float, float, float, float]:
+        # Transformations are drawn and applied every frame, so keep their top two rows as plain floats
+        if self._affine_coefficients is None:
+            self._affine_coefficients = _affine_coefficients_of(self.matrix)
+
+        return self._affine_coefficients
+
+
+def apply_chain_many(points: np.ndarray, transformations: Iterable[AffineTransformation]) -> np.ndarray:
+    # Fuse the chain into a single matrix so the points are only traversed once
+    return functools.reduce(
+        AffineTransformation.transform,
+        transformations,
+        AffineTransformation(),
+    ).apply_many(points)
+
+
+def _transform_vectors(
+        affine_coefficients: tuple[float, float, float, float, float, float],
+        transformable: _ATransformable,
+) -> _ATransformable:
+    a, b, c, d, e, f = affine_coefficients
+    # Bind the constructor once instead of creating a bound classmethod for every vector
+    from_floats = Vector2d._from_floats
+
+    return transformable.__from_vectors__(iter([
+        from_floats(a * vector.x + b * vector.y + c, d * vector.x + e * vector.y + f)
+        for vector in transformable.__as_vectors__()
+    ]))
 
-        return transformable.__from_vectors__(
-            inverse_transform_vector(vector)
-            for vector in transformable.__as_vectors__()
-        )
+
+def _affine_coefficients_of(matrix: Matrix3x3) -> tuple[float, float, float, float, float, float]:
+    # The bottom row of an affine matrix only produces the homogeneous coordinate, so skip it
+    (a, b, c), (d, e, f), _ = matrix._matrix.tolist()
+
+    return a, b, c, d, e, f
+
+
+def _copy_transformable(transformable: _ATransformable) -> _ATransformable:
+    from_floats = Vector2d._from_floats
+
+    return transformable.__from_vectors__(
+        from_floats(vector.x, vector.y)
+        for vector in transformable.__as_vectors__()
+    )
+
+
+def _apply_matrix_to_points(matrix: np.ndarray, points: np.ndarray) -> np.ndarray:
+    points = np.asarray(points, dtype=np.float64)
+
+    # Only the two affine rows contribute to the result, so skip the homogeneous
+    # coordinate and the constant bottom row entirely. Multiplying from the right
+    # works for a single point of shape (2,) as well as for an (N, 2) array
+    transformed = points.dot(matrix[:2, :2].T)
+    transformed += matrix[:2, 2]
+
+    return transformed
 
 
 class Transformable(Protocol):
+    __slots__ = ()
 
     def __as_vectors__(self) -> Iterator[Vector2d]: ...
 
@@ -313,11 +498,12 @@ _ATransformable = TypeVar("_ATransformable", bound=Transformable)
 
 
 class SupportsApproxEquals(Protocol):
+    __slots__ = ()
 
     def __approx_equals__(self, other: SupportsApproxEquals, threshold: float) -> bool: ...
 
 
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class Vector2d(Transformable, SupportsApproxEquals):
     x: float
     y: float
@@ -326,6 +512,15 @@ class Vector2d(Transformable, SupportsApproxEquals):
         self.x = float(x)
         self.y = float(y)
 
+    @classmethod
+    def _from_floats(cls, x: float, y: float) -> Vector2d:
+        inst = cls.__new__(cls)
+
+        inst.x = x
+        inst.y = y
+
+        return inst
+
     def __getitem__(self, index: int) -> float:
         if index == 0:
             return self.x
@@ -335,20 +530,19 @@ class Vector2d(Transformable, SupportsApproxEquals):
         raise IndexError(f"{type(self).__name__} only has 2 axes")
 
     def __iter__(self) -> Iterator[float]:
-        yield self.x
-        yield self.y
+        return iter((self.x, self.y))
 
     def __add__(self, other: Any) -> Vector2d:
-        if isinstance(other, type(self)):
-            return type(self)(self.x + other.x, self.y + other.y)
+        if type(other) is (cls := type(self)):
+            return cls._from_floats(self.x + other.x, self.y + other.y)
 
         raise TypeError(
             f"{type(self).__name__} can only be added to another {type(self).__name__}"
         )
 
     def __mul__(self, other: Any) -> Vector2d:
-        if type(other) in frozenset({int, float}):
-            return type(self)(other * self.x, other * self.y)
+        if (type_ := type(other)) is float or type_ is int:
+            return type(self)._from_floats(other * self.x, other * self.y)
 
         raise TypeError(
             f"{type(self).__name__} can only be multiplied by a scalar integer of float"
@@ -358,7 +552,7 @@ class Vector2d(Transformable, SupportsApproxEquals):
         return f"vec2({self.x}, {self.y})"
 
     def __str__(self) -> str:
-        col_width = max(len(f"{val:.5}") for val in self)
+        col_width = max(len(f"{self.x:.5}"), len(f"{self.y:.5}"))
 
         return (
             f"/{self.x:<{col_width}.5}\\\n"
@@ -378,7 +572,7 @@ class Vector2d(Transformable, SupportsApproxEquals):
         )
 
 
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class Vector3d(SupportsApproxEquals):
     x: float
     y: float
@@ -389,6 +583,16 @@ class Vector3d(SupportsApproxEquals):
         self.y = float(y)
         self.z = float(z)
 
+    @classmethod
+    def _from_floats(cls, x: float, y: float, z: float) -> Vector3d:
+        inst = cls.__new__(cls)
+
+        inst.x = x
+        inst.y = y
+        inst.z = z
+
+        return inst
+
     def __getitem__(self, index: int) -> float:
         if index == 0:
             return self.x
@@ -400,23 +604,21 @@ class Vector3d(SupportsApproxEquals):
         raise IndexError(f"{type(self).__name__} only has 3 axes")
 
     def __iter__(self) -> Iterator[float]:
-        yield self.x
-        yield self.y
-        yield self.z
+        return iter((self.x, self.y, self.z))
 
     def __add__(self, other: Any) -> Vector3d:
-        if isinstance(other, type(self)):
-            return type(self)(self.x + other.x, self.y + other.y, self.z + other.z)
+        if type(other) is (cls := type(self)):
+            return cls._from_floats(self.x + other.x, self.y + other.y, self.z + other.z)
 
         raise TypeError(
             f"{type(self).__name__} can only be added to another {type(self).__name__}"
         )
 
     def __mul__(self, other: Any) -> Vector3d:
-        if type(other) in frozenset({int, float}):
-            return type(self)(other * self.x, other * self.y, other * self.z)
+        if (type_ := type(other)) is float or type_ is int:
+            return type(self)._from_floats(other * self.x, other * self.y, other * self.z)
 
-        if isinstance(other, Matrix3x3):
+        if type_ is Matrix3x3:
             # Implemented by 3x3 matrix
             return NotImplemented
 
@@ -428,7 +630,7 @@ class Vector3d(SupportsApproxEquals):
         return f"vec3({self.x}, {self.y}, {self.z})"
 
     def __str__(self) -> str:
-        col_width = max(len(f"{val:.5}") for val in self)
+        col_width = max(len(f"{self.x:.5}"), len(f"{self.y:.5}"), len(f"{self.z:.5}"))
 
         return (
             f"/{self.x:<{col_width}.5}\\\n"
@@ -445,6 +647,7 @@ class Vector3d(SupportsApproxEquals):
 
 
 class SupportsDeterminant(Protocol):
+    __slots__ = ()
 
     def __det__(self) -> float: ...
 
@@ -454,6 +657,7 @@ def det(val: SupportsDeterminant) -> float:
 
 
 class _BaseMatrix(SupportsApproxEquals, SupportsDeterminant, ABC):
+    __slots__ = ()
 
     @overload
     def __pow__(self, exponent: Any) -> NoReturn: ...
@@ -485,12 +689,9 @@ class _BaseMatrix(SupportsApproxEquals, SupportsDeterminant, ABC):
     def __copy__(self) -> _BaseMatrix: ...
 
 
-@dataclass(init=False)
+@dataclass(init=False, eq=False, slots=True)
 class Matrix2x2(_BaseMatrix):
-    _matrix: tuple[
-        tuple[float, float],
-        tuple[float, float],
-    ]
+    _matrix: np.ndarray
 
     def __init__(
             self,
@@ -498,18 +699,33 @@ class Matrix2x2(_BaseMatrix):
             row2: tuple[float | int, float | int],
             /,
     ) -> None:
-        self._matrix = (
-            tuple(float(val) for val in row1),
-            tuple(float(val) for val in row2),
-        )
+        self._matrix = np.array((row1, row2), dtype=np.float64)
+        self._matrix.flags.writeable = False
+
+    @classmethod
+    def _from_array(cls, array: np.ndarray) -> Matrix2x2:
+        inst = cls.__new__(cls)
+
+        inst._matrix = array
+        array.flags.writeable = False
+
+        return inst
+
+    @classmethod
+    def _from_rows(cls, row1: tuple[float, float], row2: tuple[float, float], /) -> Matrix2x2:
+        return cls._from_array(np.array((*row1, *row2)).reshape(2, 2))
 
     def __getitem__(self, index: int) -> tuple[float, float]:
-        return self._matrix[index]
+        return tuple(self._matrix[index].tolist())
 
-    def __iter__(self) -> Iterator[
-        tuple[float, float],
-    ]:
-        return iter(self._matrix)
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        return map(tuple, self._matrix.tolist())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, type(self)):
+            return bool(np.array_equal(self._matrix, other._matrix))
+
+        return NotImplemented
 
     @overload
     def __mul__(self, other: Any) -> NoReturn: ...
@@ -521,11 +737,11 @@ class Matrix2x2(_BaseMatrix):
     def __mul__(self, vector2d: Vector2d) -> Vector2d: ...
 
     def __mul__(self, other: Any) -> Matrix2x2 | Vector2d | NoReturn:
-        if isinstance(other, Vector2d):
-            return self._multiply_by_vector(other)
+        if isinstance(other, cls := type(self)):
+            return cls._from_array(self._matrix.dot(other._matrix))
 
-        if isinstance(other, type(self)):
-            return self._multiply_by_matrix(other)
+        if type(other) is Vector2d:
+            return self._multiply_by_vector(other)
 
         raise TypeError(
             f"{type(self).__name__} can only have a 2x2 matrix or vector with 2 rows after multiplication operand"
@@ -546,16 +762,20 @@ class Matrix2x2(_BaseMatrix):
         )
 
     def __repr__(self) -> str:
-        return f"mat2x2({self[0]}, {self[1]})"
+        row1, row2 = self._matrix.tolist()
+
+        return f"mat2x2({tuple(row1)}, {tuple(row2)})"
 
     def __str__(self) -> str:
+        rows = self._matrix.tolist()
+
         col_widths = [
-            max(len(f"{self[row][column]:.5}") for row in range(2))
+            max(len(f"{rows[row][column]:.5}") for row in range(2))
             for column in range(2)
         ]
 
         formatted_vals = [
-            [f"{self[row][column]:<{col_widths[column]}.5}" for column in range(2)]
+            [f"{rows[row][column]:<{col_widths[column]}.5}" for column in range(2)]
             for row in range(2)
         ]
 
@@ -565,62 +785,49 @@ class Matrix2x2(_BaseMatrix):
         )
 
     def __det__(self) -> float:
-        return self[0][0] * self[1][1] - self[0][1] * self[1][0]
+        (a, b), (c, d) = self._matrix.tolist()
+
+        return a * d - b * c
 
     def __transpose__(self) -> Matrix2x2:
-        return type(self)(
-            (self[0][0], self[1][0]),
-            (self[0][1], self[1][1]),
-        )
+        return self._from_array(self._matrix.T)
 
     def __inverse__(self) -> Matrix2x2:
-        return (1 / det(self)) * type(self)(
-            (self[0][0], -self[0][1]),
-            (-self[1][0], self[1][1])
+        (a, b), (c, d) = self._matrix.tolist()
+        inv_det = 1 / (a * d - b * c)
+
+        return self._from_rows(
+            ( d * inv_det, -b * inv_det),
+            (-c * inv_det,  a * inv_det),
         )
 
     def __approx_equals__(self, other: Matrix2x2, threshold: float) -> bool:
-        return all(
-            approx_equals(self[row][column], other[row][column], threshold)
-            for row in range(2)
-            for column in range(2)
+        (a, b), (c, d) = self._matrix.tolist()
+        (other_a, other_b), (other_c, other_d) = other._matrix.tolist()
+
+        return (
+                a - threshold <= other_a <= a + threshold
+                and b - threshold <= other_b <= b + threshold
+                and c - threshold <= other_c <= c + threshold
+                and d - threshold <= other_d <= d + threshold
         )
 
     def __copy__(self) -> Matrix2x2:
-        return type(self)(self._matrix[0], self._matrix[1])
+        return self._from_array(self._matrix.copy())
 
     def _multiply_by_vector(self, vector: Vector2d) -> Vector2d:
-        return Vector2d(
-            self[0][0] * vector[0] + self[0][1] * vector[1],
-            self[1][0] * vector[1] + self[1][1] * vector[1],
-        )
+        (a, b), (c, d) = self._matrix.tolist()
+        x, y = vector.x, vector.y
 
-    def _multiply_by_matrix(self, matrix: Matrix2x2) -> Matrix2x2:
-        return type(self)(
-            (
-                self[0][0] * matrix[0][0] + self[0][1] * matrix[1][0],
-                self[0][0] * matrix[0][1] + self[0][1] * matrix[1][1],
-            ),
-            (
-                self[1][0] * matrix[0][0] + self[1][1] * matrix[1][0],
-                self[1][0] * matrix[0][1] + self[1][1] * matrix[1][1],
-            ),
-        )
+        return Vector2d._from_floats(a * x + b * y, c * x + d * y)
 
     def _multiply_by_scalar(self, scalar: float | int) -> Matrix2x2:
-        return type(self)(
-            (scalar * self[0][0], scalar * self[0][1]),
-            (scalar * self[1][0], scalar * self[1][1])
-        )
+        return self._from_array(scalar * self._matrix)
 
 
-@dataclass(init=False)
+@dataclass(init=False, eq=False, slots=True)
 class Matrix3x3(_BaseMatrix):
-    _matrix: tuple[
-        tuple[float, float, float],
-        tuple[float, float, float],
-        tuple[float, float, float],
-    ]
+    _matrix: np.ndarray
 
     def __init__(
             self,
@@ -629,21 +836,40 @@ class Matrix3x3(_BaseMatrix):
             row3: tuple[float | int, float | int, float | int],
             /,
     ) -> None:
-        self._matrix = (
-            tuple(float(val) for val in row1),
-            tuple(float(val) for val in row2),
-            tuple(float(val) for val in row3)
-        )
+        self._matrix = np.array((row1, row2, row3), dtype=np.float64)
+        self._matrix.flags.writeable = False
+
+    @classmethod
+    def _from_array(cls, array: np.ndarray) -> Matrix3x3:
+        inst = cls.__new__(cls)
+
+        inst._matrix = array
+        array.flags.writeable = False
+
+        return inst
+
+    @classmethod
+    def _from_rows(
+            cls,
+            row1: tuple[float, float, float],
+            row2: tuple[float, float, float],
+            row3: tuple[float, float, float],
+            /,
+    ) -> Matrix3x3:
+        # Building from a flat sequence of floats is cheaper than from nested rows
+        return cls._from_array(np.array((*row1, *row2, *row3)).reshape(3, 3))
 
     def __getitem__(self, index: int) -> tuple[float, float, float]:
-        return self._matrix[index]
+        return tuple(self._matrix[index].tolist())
 
-    def __iter__(self) -> Iterator[
-        tuple[float, float, float],
-        tuple[float, float, float],
-        tuple[float, float, float],
-    ]:
-        return iter(self._matrix)
+    def __iter__(self) -> Iterator[tuple[float, float, float]]:
+        return map(tuple, self._matrix.tolist())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, type(self)):
+            return bool(np.array_equal(self._matrix, other._matrix))
+
+        return NotImplemented
 
     @overload
     def __mul__(self, other: Any) -> NoReturn: ...
@@ -655,11 +881,11 @@ class Matrix3x3(_BaseMatrix):
     def __mul__(self, vector3d: Vector3d) -> Vector3d: ...
 
     def __mul__(self, other: Any) -> Matrix3x3 | Vector3d | NoReturn:
-        if isinstance(other, Vector3d):
-            return self._multiply_by_vector(other)
+        if isinstance(other, cls := type(self)):
+            return cls._from_array(self._matrix.dot(other._matrix))
 
-        if isinstance(other, type(self)):
-            return self._multiply_by_matrix(other)
+        if type(other) is Vector3d:
+            return self._multiply_by_vector(other)
 
         raise TypeError(
             f"{type(self).__name__} can only have a 3x3 matrix or vector with 3 rows after multiplication operand"
@@ -680,16 +906,20 @@ class Matrix3x3(_BaseMatrix):
         )
 
     def __repr__(self) -> str:
-        return f"mat3x3({self[0]}, {self[1]}, {self[2]})"
+        row1, row2, row3 = self._matrix.tolist()
+
+        return f"mat3x3({tuple(row1)}, {tuple(row2)}, {tuple(row3)})"
 
     def __str__(self) -> str:
+        rows = self._matrix.tolist()
+
         col_widths = [
-            max(len(f"{self[row][column]:.5}") for row in range(3))
+            max(len(f"{rows[row][column]:.5}") for row in range(3))
             for column in range(3)
         ]
 
         formatted_vals = [
-            [f"{self[row][column]:<{col_widths[column]}.5}" for column in range(3)]
+            [f"{rows[row][column]:<{col_widths[column]}.5}" for column in range(3)]
             for row in range(3)
         ]
 
@@ -700,84 +930,77 @@ class Matrix3x3(_BaseMatrix):
         )
 
     def __det__(self) -> float:
+        (a, b, c), (d, e, f), (g, h, i) = self._matrix.tolist()
+
         # Rule of Sarrus
         return (
-                self[0][0] * self[1][1] * self[2][2]
-                + self[0][1] * self[1][2] * self[2][0]
-                + self[0][2] * self[1][0] * self[2][1]
-                - self[0][2] * self[1][1] * self[2][0]
-                - self[0][0] * self[1][2] * self[2][1]
-                - self[0][1] * self[1][0] * self[2][2]
+                a * e * i
+                + b * f * g
+                + c * d * h
+                - c * e * g
+                - a * f * h
+                - b * d * i
         )
 
     def __inverse__(self) -> Matrix3x3:
-        return (1 / det(self)) * type(self)(
-            (
-                self[1][1] * self[2][2] - self[1][2] * self[2][1],
-                - (self[1][0] * self[2][2] - self[1][2] * self[2][0]),
-                self[1][0] * self[2][1] - self[1][1] * self[2][0]
-            ),
-            (
-                - (self[0][1] * self[2][2] - self[0][2] * self[2][1]),
-                self[0][0] * self[2][2] - self[0][2] * self[2][0],
-                - (self[0][0] * self[2][1] - self[0][1] * self[2][0])
-            ),
-            (
-                self[0][1] * self[1][2] - self[0][2] * self[1][1],
-                - (self[0][0] * self[1][2] - self[0][2] * self[1][0]),
-                self[0][0] * self[1][1] - self[0][1] * self[1][0]
+        (a, b, c), (d, e, f), (g, h, i) = self._matrix.tolist()
+
+        if g == 0 and h == 0 and i == 1:
+            # Closed-form inverse of a 2D affine transformation: [[R^-1, -R^-1 t], [0, 0, 1]]
+            inv_det = 1 / (a * e - b * d)
+
+            return self._from_rows(
+                ( e * inv_det, -b * inv_det, (b * f - e * c) * inv_det),
+                (-d * inv_det,  a * inv_det, (d * c - a * f) * inv_det),
+                ( 0.0        ,  0.0        ,  1.0                     ),
             )
-        ) ** "T"
 
-    def __transpose__(self) -> Matrix3x3:
-        return type(self)(
-            (self[0][0], self[1][0], self[2][0]),
-            (self[0][1], self[1][1], self[2][1]),
-            (self[0][2], self[1][2], self[2][2]),
+        # Adjugate over the determinant, with the cofactors written out already transposed
+        cofactor_a = e * i - f * h
+        cofactor_b = f * g - d * i
+        cofactor_c = d * h - e * g
+        inv_det = 1 / (a * cofactor_a + b * cofactor_b + c * cofactor_c)
+
+        return self._from_rows(
+            (cofactor_a * inv_det, (c * h - b * i) * inv_det, (b * f - c * e) * inv_det),
+            (cofactor_b * inv_det, (a * i - c * g) * inv_det, (c * d - a * f) * inv_det),
+            (cofactor_c * inv_det, (b * g - a * h) * inv_det, (a * e - b * d) * inv_det),
         )
 
+    def __transpose__(self) -> Matrix3x3:
+        return self._from_array(self._matrix.T)
+
     def __copy__(self) -> Matrix3x3:
-        return type(self)(self._matrix[0], self._matrix[1], self._matrix[2])
+        return self._from_array(self._matrix.copy())
 
     def __approx_equals__(self, other: Matrix3x3, threshold: float) -> bool:
-        return all(
-            approx_equals(self[row][column], other[row][column], threshold)
-            for row in range(3)
-            for column in range(3)
+        (a, b, c), (d, e, f), (g, h, i) = self._matrix.tolist()
+        (other_a, other_b, other_c), (other_d, other_e, other_f), (other_g, other_h, other_i) = other._matrix.tolist()
+
+        return (
+                a - threshold <= other_a <= a + threshold
+                and b - threshold <= other_b <= b + threshold
+                and c - threshold <= other_c <= c + threshold
+                and d - threshold <= other_d <= d + threshold
+                and e - threshold <= other_e <= e + threshold
+                and f - threshold <= other_f <= f + threshold
+                and g - threshold <= other_g <= g + threshold
+                and h - threshold <= other_h <= h + threshold
+                and i - threshold <= other_i <= i + threshold
         )
 
     def _multiply_by_vector(self, vector: Vector3d) -> Vector3d:
-        return Vector3d(
-            self[0][0] * vector[0] + self[0][1] * vector[1] + self[0][2] * vector[2],
-            self[1][0] * vector[0] + self[1][1] * vector[1] + self[1][2] * vector[2],
-            self[2][0] * vector[0] + self[2][1] * vector[1] + self[2][2] * vector[2],
-        )
+        (a, b, c), (d, e, f), (g, h, i) = self._matrix.tolist()
+        x, y, z = vector.x, vector.y, vector.z
 
-    def _multiply_by_matrix(self, matrix: Matrix3x3) -> Matrix3x3:
-        return type(self)(
-            (
-                self[0][0] * matrix[0][0] + self[0][1] * matrix[1][0] + self[0][2] * matrix[2][0],
-                self[0][0] * matrix[0][1] + self[0][1] * matrix[1][1] + self[0][2] * matrix[2][1],
-                self[0][0] * matrix[0][2] + self[0][1] * matrix[1][2] + self[0][2] * matrix[2][2],
-            ),
-            (
-                self[1][0] * matrix[0][0] + self[1][1] * matrix[1][0] + self[1][2] * matrix[2][0],
-                self[1][0] * matrix[0][1] + self[1][1] * matrix[1][1] + self[1][2] * matrix[2][1],
-                self[1][0] * matrix[0][2] + self[1][1] * matrix[1][2] + self[1][2] * matrix[2][2],
-            ),
-            (
-                self[2][0] * matrix[0][0] + self[2][1] * matrix[1][0] + self[2][2] * matrix[2][0],
-                self[2][0] * matrix[0][1] + self[2][1] * matrix[1][1] + self[2][2] * matrix[2][1],
-                self[2][0] * matrix[0][2] + self[2][1] * matrix[1][2] + self[2][2] * matrix[2][2],
-            ),
-        )
+        return Vector3d._from_floats(a * x + b * y + c * z, d * x + e * y + f * z, g * x + h * y + i * z)
 
     def _multiply_by_scalar(self, scalar: float | int) -> Matrix3x3:
-        return type(self)(
-            (scalar * self[0][0], scalar * self[0][1], scalar * self[0][2]),
-            (scalar * self[1][0], scalar * self[1][1], scalar * self[1][2]),
-            (scalar * self[2][0], scalar * self[2][1], scalar * self[2][2])
-        )
+        return self._from_array(scalar * self._matrix)
+
+
+# Shared by every new AffineTransformation
+_IDENTITY_MATRIX = Matrix3x3._from_array(np.identity(3))
 
 
 @overload
@@ -792,23 +1015,30 @@ def approx_equals(
         *args: SupportsApproxEquals | float | Iterable[SupportsApproxEquals | float] | float,
         **kwargs: float,
 ) -> bool:
-    try:
-        threshold = kwargs["threshold"]
-    except KeyError:
-        *args, threshold = args
+    threshold = kwargs.get("threshold")
+    if threshold is None:
+        threshold = args[-1]
+        args = args[:-1]
 
     if len(args) == 2:
-        a, b = args
-        return approx_equals((a, b), threshold)
-
-    args = list(*args)
-    for i, a in enumerate(args[:-1]):
-        for b in args[i + 1:]:
-            try:
-                if not a.__approx_equals__(b, threshold):
-                    return False
-            except AttributeError:
-                if not a - threshold <= b <= a + threshold:
-                    return False
-
-    return True
+        first = args[0]
+
+        if (type_ := type(first)) is float or type_ is int:
+            return abs(first - args[1]) <= threshold
+
+        items = args
+    else:
+        items = tuple(*args)
+
+    if not items:
+        return True
+
+    if hasattr(type(items[0]), "__approx_equals__"):
+        return all(
+            a.__approx_equals__(b, threshold)
+            for i, a in enumerate(items[:-1])
+            for b in items[i + 1:]
+        )
+
+    # Every pair of scalars is within the threshold exactly when the extremes are
+    return max(items) - min(items) <= threshold
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import cast
 
 from . import geometry
@@ -8,7 +8,7 @@ from .component import Component
 from .shapes import Line, Rect, Vertex, Shape
 
 
-@dataclass
+@dataclass(slots=True)
 class RobotMeasurements:
     wheel_base: float
     track_width: float
@@ -31,10 +31,15 @@ class Robot(Component):
 
     @property
     def measurements(self) -> RobotMeasurements:
-        return self._measurements
+        # Handed out as a copy so that changing it can't alter the snapshot the setter compares against
+        return replace(self._measurements)
 
     @measurements.setter
     def measurements(self, measurements: RobotMeasurements) -> None:
+        # Rebuilding replaces every axel, wheel and shape, so don't do it for the same measurements
+        if measurements == self._measurements:
+            return
+
         self._update_measurements(measurements)
 
     @property
@@ -43,6 +48,9 @@ class Robot(Component):
 
     @translation.setter
     def translation(self, vector: geometry.Vector2d) -> None:
+        if vector == self._translation:
+            return
+
         self._translation = vector
 
         self._update_transformation()
@@ -53,10 +61,25 @@ class Robot(Component):
 
     @rotation.setter
     def rotation(self, angle: float) -> None:
+        if angle == self._rotation:
+            return
+
         self._rotation = angle
 
         self._update_transformation()
 
+    def set_pose(self, translation: geometry.Vector2d, rotation: float) -> Robot:
+        # Update the transformation once rather than once per setter
+        if translation == self._translation and rotation == self._rotation:
+            return self
+
+        self._translation = translation
+        self._rotation = rotation
+
+        self._update_transformation()
+
+        return self
+
     @property
     def steering_angle(self) -> float:
         return self._steering_angle
@@ -98,7 +121,8 @@ class Robot(Component):
             )
         )
 
-        self._measurements = measurements
+        # Keep a snapshot, the caller may change their measurements and assign them again
+        self._measurements = replace(measurements)
         # Reposition front wheels' angle
         self._update_steering_angle(self._steering_angle)
 
@@ -174,6 +198,7 @@ class Wheel(Component):
         self._width = width
         self._diameter = diameter
         self._rotation = 0
+        self._placement = geometry.AffineTransformation()
 
         super().__init__(wheel=self._create_shape())
 
@@ -183,15 +208,26 @@ class Wheel(Component):
 
     @rotation.setter
     def rotation(self, angle: str) -> None:
+        if angle == self._rotation:
+            return
+
         self._rotation = angle
 
-        self.update_shape(wheel=self._create_shape())
+        self._update_transformation()
+
+    def transform(self, transformation: geometry.AffineTransformation) -> Wheel:
+        self._placement = self._placement.transform(transformation)
+
+        self._update_transformation()
+
+        return self
+
+    def _update_transformation(self) -> None:
+        # Rotate the wheel through its transformation so that its shape never has to be rebuilt
+        self.transformation = geometry.rotate(self._rotation).transform(self._placement)
 
     def _create_shape(self) -> Shape:
-        return geometry.transform(
-            Rect(
-                Vertex(-self._width / 2, -self._diameter / 2),
-                Vertex(self._width, self._diameter)
-            ),
-            geometry.rotate(self._rotation)
+        return Rect(
+            Vertex(-self._width / 2, -self._diameter / 2),
+            Vertex(self._width, self._diameter)
         )
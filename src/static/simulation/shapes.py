@@ -2,37 +2,16 @@ from __future__ import annotations
 
 from asyncio import Protocol
 from collections.abc import Iterator
-from copy import copy
 from dataclasses import dataclass
 
 from . import geometry
 
 
-@dataclass(init=False)
-class Vertex:
-    vector: geometry.Vector2d
-
-    def __init__(self, x: float, y: float) -> None:
-        self.vector = geometry.Vector2d(x, y)
-
-    @property
-    def x(self) -> float:
-        return self.vector.x
-
-    @x.setter
-    def x(self, value: float) -> None:
-        self.vector.x = value
+# Vertices are plain vectors, so transformed vectors can become vertices without being wrapped
+Vertex = geometry.Vector2d
 
-    @property
-    def y(self) -> float:
-        return self.vector.y
 
-    @y.setter
-    def y(self, value: float) -> None:
-        self.vector.y = value
-
-
-@dataclass
+@dataclass(slots=True)
 class Style:
     fill_color: str | None = "white"
     stroke_color: str | None = "black"
@@ -41,6 +20,9 @@ class Style:
 
 @dataclass(init=False)
 class Shape(Protocol, geometry.Transformable):
+    # Declared by hand rather than with slots=True, which would break the zero-argument super() calls in subclasses
+    __slots__ = ("style", "_vertices", "_version", "render_cache")
+
     style: Style
     _vertices: list[Vertex]
 
@@ -50,33 +32,46 @@ class Shape(Protocol, geometry.Transformable):
             style: Style | None = None,
     ) -> None:
         self._vertices = []
+        self._version = 0
+        # Free for renderers to keep whatever they derive from the vertices, together with the version it is for
+        self.render_cache = None
         self.style = style or Style()
 
+    @property
+    def version(self) -> int:
+        # Changes whenever the vertices do
+        return self._version
+
     @property
     def vertices(self) -> list[Vertex]:
         return self._vertices[:]
 
+    def iter_vertices(self) -> Iterator[Vertex]:
+        return iter(self._vertices)
+
     def __as_vectors__(self) -> Iterator[geometry.Vector2d]:
-        return (vertex.vector for vertex in self._vertices)
+        return iter(self._vertices)
 
     def __from_vectors__(self, vectors: Iterator[geometry.Vector2d]) -> Shape:
-        new_shape = copy(self)
-
-        new_vertices = []
-        for _ in range(len(self._vertices)):
-            vector = next(vectors)
-            new_vertex = Vertex(vector.x, vector.y)
-            new_vertices.append(new_vertex)
+        # Only the vertices change, so share the remaining state instead of copying the whole shape
+        new_shape = object.__new__(type(self))
+        new_shape.style = self.style
+        new_shape._version = 0
+        new_shape.render_cache = None
 
-        new_shape._vertices = new_vertices
+        # Transformations hand over freshly created vectors, so they can be used as the vertices directly
+        new_shape._vertices = [vector for _, vector in zip(self._vertices, vectors)]
 
         return new_shape
 
-    def __copy__(self) -> Shape: ...
+    def __copy__(self) -> Shape:
+        # Vertices are mutable, so only they need copying; the rest of the state is shared
+        return self.__from_vectors__(geometry.Vector2d(vertex.x, vertex.y) for vertex in self._vertices)
 
 
 @dataclass(init=False)
 class Line(Shape):
+    __slots__ = ()
 
     def __init__(
             self,
@@ -97,18 +92,10 @@ class Line(Shape):
     def end(self) -> Vertex:
         return self._vertices[1]
 
-    def __copy__(self) -> Line:
-        new_instance = Line(Vertex(0, 0), Vertex(0, 0))
-        new_instance._vertices = [
-            Vertex(v.x, v.y)
-            for v in self._vertices
-        ]
-
-        return new_instance
-
 
 @dataclass(init=False)
 class Polygon(Shape):
+    __slots__ = ()
 
     def __init__(self, *vertices: Vertex, style: Style | None = None) -> None:
         super().__init__(style=style)
@@ -116,12 +103,14 @@ class Polygon(Shape):
 
     def add_vertex(self, vertex: Vertex) -> Polygon:
         self._vertices.append(vertex)
+        self._version += 1
 
         return self
 
 
 @dataclass(init=False)
 class Rect(Polygon):
+    __slots__ = ()
 
     def __init__(
             self,
@@ -134,13 +123,13 @@ class Rect(Polygon):
         x, y = origin.x, origin.y
         width, height = extent.x, extent.y
 
-        super().__init__(
+        super().__init__(style=style)
+        self._vertices = [
             Vertex(x, y),
             Vertex(x + width, y),
             Vertex(x + width, y + height),
             Vertex(x, y + height),
-            style=style
-        )
+        ]
 
     @property
     def origin(self) -> Vertex:
@@ -166,12 +155,3 @@ class Rect(Polygon):
     @property
     def top_right(self) -> Vertex:
         return self._vertices[2]
-
-    def __copy__(self) -> Rect:
-        new_instance = Rect(Vertex(0, 0), Vertex(0, 0))
-        new_instance._vertices = [
-            Vertex(v.x, v.y)
-            for v in self._vertices
-        ]
-
-        return new_instance
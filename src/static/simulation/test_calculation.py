@@ -0,0 +1,38 @@
+import math
+
+import numpy as np
+
+from .calculation import Odometry, calculate_next_odometry, calculate_odometry_trajectory
+
+
+def test_odometry_trajectory_matches_stepwise_odometry() -> None:
+    rng = np.random.default_rng(0)
+    times_elapsed = rng.uniform(0.01, 0.03, size=1_000)
+    speeds = rng.uniform(-0.4, 0.4, size=1_000)
+    steering_angles = rng.uniform(-math.pi / 4, math.pi / 4, size=1_000)
+    steering_angles[::10] = 0
+    odometry = Odometry(translation_x=1, translation_y=2, rotation=math.pi)
+
+    trajectory = calculate_odometry_trajectory(
+        odometry,
+        times_elapsed_between_odometry_measurements=times_elapsed,
+        speeds=speeds,
+        wheel_base=0.2,
+        steering_angles=steering_angles,
+    )
+
+    for i, (time_elapsed, speed, steering_angle) in enumerate(zip(times_elapsed, speeds, steering_angles)):
+        odometry = calculate_next_odometry(
+            odometry,
+            time_elapsed_since_last_odometry_measurement=time_elapsed,
+            speed=speed,
+            wheel_base=0.2,
+            steering_angle=steering_angle,
+        )
+
+        assert math.isclose(trajectory.translation_x[i], odometry.translation_x, rel_tol=0, abs_tol=1e-10)
+        assert math.isclose(trajectory.translation_y[i], odometry.translation_y, rel_tol=0, abs_tol=1e-10)
+        assert -math.pi <= odometry.rotation < math.pi
+        assert math.isclose(
+            math.remainder(trajectory.rotation[i] - odometry.rotation, 2 * math.pi), 0, rel_tol=0, abs_tol=1e-10
+        )
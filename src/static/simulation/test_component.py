@@ -0,0 +1,21 @@
+from . import geometry
+from .component import Component
+from .shapes import Line, Vertex
+
+
+def test_world_transformations_follow_replaced_parent_transformation() -> None:
+    child = Component(line=Line(Vertex(0, 0), Vertex(1, 0)))
+    child.transform(geometry.translate(1, 0))
+    root = Component(children={"child": child})
+
+    [(_, first_transformation)] = root.shapes_with_world_transformations()
+    [(_, second_transformation)] = root.shapes_with_world_transformations()
+
+    assert second_transformation is first_transformation
+
+    root.transform(geometry.translate(0, 2))
+
+    [(_, moved_transformation)] = root.shapes_with_world_transformations()
+
+    assert moved_transformation is not first_transformation
+    assert geometry.transform(Vertex(0, 0), moved_transformation) == Vertex(1, 2)
@@ -1,12 +1,16 @@
 import math
 
+import numpy as np
+
 from .geometry import (
     AffineTransformation,
+    apply_chain_many,
     approx_equals,
     det,
     Matrix2x2,
     Matrix3x3,
     Vector2d,
+    Vector3d,
     rotate,
     scale,
     transform,
@@ -48,6 +52,25 @@ def test_2x2_matrix_inverse():
     assert m == inverse ** -1
 
 
+def test_2x2_matrix_vector_product():
+    m = Matrix2x2(
+        (1, 2),
+        (3, 4)
+    )
+
+    assert m * Vector2d(5, 6) == Vector2d(17, 39)
+
+
+def test_3x3_matrix_vector_product():
+    m = Matrix3x3(
+        (1, 2, 3),
+        (3, 2, 1),
+        (2, 1, 3)
+    )
+
+    assert m * Vector3d(1, 2, 3) == Vector3d(14, 10, 13)
+
+
 def test_3x3_matrix_inverse():
     m = Matrix3x3(
         (1, 2, 3),
@@ -59,6 +82,19 @@ def test_3x3_matrix_inverse():
     assert approx_equals(m, inverse ** -1, threshold=1e-10)
 
 
+def test_3x3_affine_matrix_inverse():
+    m = Matrix3x3(
+        (1, 2, 3),
+        (3, 2, 1),
+        (0, 0, 1)
+    )
+    inverse = m ** -1
+
+    assert inverse[2][0] == inverse[2][1] == 0 and inverse[2][2] == 1
+    assert approx_equals(m * inverse, Matrix3x3((1, 0, 0), (0, 1, 0), (0, 0, 1)), threshold=1e-10)
+    assert approx_equals(m, inverse ** -1, threshold=1e-10)
+
+
 def test_affine_transformation_translate() -> None:
     assert transform(
         Vector2d(3, 4),
@@ -93,6 +129,22 @@ def test_affine_transformation_translate() -> None:
     ) == Vector2d(4, 6)
 
 
+def test_affine_transformation_translate_directions() -> None:
+    assert transform(
+        Vector2d(3, 4),
+        AffineTransformation().translate(-1, 2, "left-then-forward")
+    ) == transform(
+        Vector2d(3, 4),
+        AffineTransformation().translate(1, -2, "right-then-down")
+    ) == transform(
+        Vector2d(3, 4),
+        AffineTransformation().translate(1, -2, ">v")
+    ) == transform(
+        Vector2d(3, 4),
+        AffineTransformation().translate(-1, -2, "left-then-down")
+    ) == Vector2d(4, 6)
+
+
 def test_affine_transformation_rotate() -> None:
     assert approx_equals([
         transform(math.sqrt(2), 0, AffineTransformation().rotate(3 * math.pi / 4)),
@@ -172,6 +224,59 @@ def test_affine_transformation_undo() -> None:
     vt = transform(v, t)
 
     assert approx_equals(v, undo_transform(vt, t), 1e-10)
+    assert approx_equals(v, undo_transform(vt.x, vt.y, t), 1e-10)
+
+
+def test_affine_transformation_identity() -> None:
+    t = translate(2, 3)
+    v = Vector2d(-3, -4)
+
+    assert AffineTransformation().transform(t) is t
+    assert t.transform(AffineTransformation()) is t
+    assert translate(2, 3).translate(-2, -3)._is_identity
+
+    vt = transform(v, AffineTransformation())
+
+    assert vt == v and vt is not v
+    assert undo_transform(v, AffineTransformation()) == v
+
+
+def test_affine_transformation_apply_many() -> None:
+    t = AffineTransformation()\
+        .translate(2, 3)\
+        .rotate(3 * math.pi / 4)\
+        .scale(1 / math.sqrt(2))
+    points = np.array([(-3, -4), (0, 0), (1, 2)])
+
+    transformed = t.apply_many(points)
+
+    assert transformed.shape == (3, 2)
+    assert all(
+        approx_equals(Vector2d(*transformed_point), transform(Vector2d(*point), t), 1e-10)
+        for point, transformed_point in zip(points, transformed)
+    )
+    assert np.allclose(t.undo_many(transformed), points, rtol=0, atol=1e-10)
+
+    single_point = np.array((-3, -4))
+
+    assert t.apply_many(single_point).shape == (2,)
+    assert np.allclose(t.apply_many(single_point), transformed[0], rtol=0, atol=1e-10)
+    assert np.allclose(t.undo_many(t.apply_many(single_point)), single_point, rtol=0, atol=1e-10)
+
+
+def test_apply_chain_many() -> None:
+    transformations = [
+        translate(2, 3),
+        rotate(3 * math.pi / 4),
+        scale(1 / math.sqrt(2), 2),
+    ]
+    points = np.random.default_rng(0).uniform(-10, 10, size=(10_000, 2))
+
+    expected = points
+    for transformation in transformations:
+        expected = transformation.apply_many(expected)
+
+    assert np.allclose(apply_chain_many(points, transformations), expected, rtol=0, atol=1e-10)
 
 
 def test_transform_translate() -> None:
@@ -233,3 +338,27 @@ def test_transform_scale() -> None:
         Vector2d(4, 5),
         scale(1/2, 1/3, "shrink")
     ) == Vector2d(8, 15)
+
+
+def test_matrices_are_immutable() -> None:
+    t = translate(1, 2)
+
+    assert t.matrix[0] == (1, 0, 1)
+    assert list(t.matrix) == [(1, 0, 1), (0, 1, 2), (0, 0, 1)]
+
+    try:
+        t.matrix._matrix[0][2] = 5
+    except ValueError:
+        pass
+
+    assert t.matrix[0] == (1, 0, 1)
+    assert transform(Vector2d(0, 0), t) == Vector2d(1, 2)
+    assert t.as_coefficients() == (1, 0, 0, 1, 1, 2)
+
+
+def test_approx_equals_compares_every_pair() -> None:
+    assert approx_equals(1, 1.5, 0.5)
+    assert approx_equals([0, 0.5, 1], 1)
+    assert not approx_equals([0.8, 0, 1.6], 1)
+    assert approx_equals([Vector2d(0, 0), Vector2d(0.5, 0.5), Vector2d(1, 1)], 1)
+    assert not approx_equals([Vector2d(0.8, 0), Vector2d(0, 0), Vector2d(1.6, 0)], 1)
@@ -0,0 +1,22 @@
+from .robot import Robot, RobotMeasurements
+
+
+def test_reassigning_changed_measurements_rebuilds_robot() -> None:
+    measurements = RobotMeasurements(wheel_base=0.2, track_width=0.2, wheel_width=0.03, wheel_diameter=0.06)
+    robot = Robot(measurements)
+    front_axel_linkage = robot.front_axel_linkage
+
+    robot.measurements = RobotMeasurements(wheel_base=0.2, track_width=0.2, wheel_width=0.03, wheel_diameter=0.06)
+
+    assert robot.front_axel_linkage is front_axel_linkage
+
+    measurements.wheel_base = 0.5
+    robot.measurements = measurements
+
+    assert robot.get_shape("center_rod").end.y == 0.5
+
+    changed_measurements = robot.measurements
+    changed_measurements.wheel_base = 0.3
+    robot.measurements = changed_measurements
+
+    assert robot.get_shape("center_rod").end.y == 0.3
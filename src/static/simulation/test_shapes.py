@@ -0,0 +1,31 @@
+from copy import copy
+
+from .shapes import Line, Polygon, Rect, Style, Vertex
+
+
+def test_copy_shapes() -> None:
+    style = Style(fill_color="red", stroke_color="blue", stroke_width=2)
+
+    for shape in [
+        Line(Vertex(0, 0), Vertex(1, 2), style=style),
+        Polygon(Vertex(0, 0), Vertex(1, 0), Vertex(0, 1), style=style),
+        Rect(Vertex(0, 0), Vertex(1, 2), style=style),
+    ]:
+        shape_copy = copy(shape)
+
+        assert type(shape_copy) is type(shape)
+        assert shape_copy.vertices == shape.vertices
+        assert all(
+            copied_vertex is not vertex
+            for copied_vertex, vertex in zip(shape_copy.iter_vertices(), shape.iter_vertices())
+        )
+        assert shape_copy.style is style
+
+
+def test_adding_a_vertex_changes_the_version() -> None:
+    polygon = Polygon(Vertex(0, 0), Vertex(1, 0))
+    version = polygon.version
+
+    polygon.add_vertex(Vertex(0, 1))
+
+    assert polygon.version != version
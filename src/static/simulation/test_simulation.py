@@ -0,0 +1,25 @@
+import math
+
+from . import Simulation, SimulationParameters
+
+
+def test_bounded_setters_clamp_to_limits() -> None:
+    parameters = SimulationParameters()
+    simulation = Simulation(parameters)
+
+    assert simulation.set_bounded_robot_speed(10).robot_speed == parameters.max_robot_speed
+    assert simulation.set_bounded_robot_speed(-10).robot_speed == parameters.min_robot_speed
+    assert simulation.set_bounded_robot_speed(0.1).robot_speed == 0.1
+
+    assert simulation.set_bounded_robot_turning_speed(10).robot_turning_speed == parameters.max_robot_turning_speed
+    assert simulation.set_bounded_robot_turning_speed(-10).robot_turning_speed == parameters.min_robot_turning_speed
+    assert simulation.set_bounded_robot_turning_speed(0.1).robot_turning_speed == 0.1
+
+    assert simulation.set_bounded_robot_steering_angle(10).robot_steering_angle == parameters.max_robot_steering_angle
+    assert simulation.set_bounded_robot_steering_angle(-10).robot_steering_angle == parameters.min_robot_steering_angle
+
+
+def test_initial_odometry_rotation_is_normalized() -> None:
+    rotation = Simulation().odometry.rotation
+
+    assert -math.pi <= rotation < math.pi
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
-from collections.abc import Callable
+import inspect
+import json
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, cast
 
-from js import document, setInterval
+from js import document, performance, requestAnimationFrame, DOMMatrix, Path2D
 from pyodide.http import pyfetch, FetchResponse
-from pyodide.ffi import create_proxy
+from pyodide.ffi import create_proxy, to_js
 
 from simulation import Simulation
 from simulation import geometry
 from simulation import Shape
-from simulation import Component
+from simulation import Style
 
 
 PIXELS_PER_SIMULATION_UNIT_MEASURE = 500
@@ -26,13 +27,14 @@ def main():
     update_feq_in_seconds = 20 / 1000
 
     body = document.getElementsByTagName("body")[0]
-    canvas.width = body.clientWidth
-    canvas.height = body.clientHeight
+    # Kept on the Python side so that clearing the canvas doesn't read them back from JS every frame
+    canvas_width = canvas.width = body.clientWidth
+    canvas_height = canvas.height = body.clientHeight
 
     simulation = Simulation().transform(
         geometry
         .scale(PIXELS_PER_SIMULATION_UNIT_MEASURE)
-        .translate(canvas.width / 2, canvas.height / 2)
+        .translate(canvas_width / 2, canvas_height / 2)
     )
 
     api = APILayer()
@@ -87,50 +89,145 @@ def main():
         .on_right_key_down(handle_right_key_down) \
         .on_right_key_up(handle_right_key_up)
 
-    def update() -> None:
-        simulation.move_forward_in_time(update_feq_in_seconds)
+    # Don't try to catch up on more than this after the tab was in the background
+    max_unsimulated_time_in_seconds = 0.25
+    unsimulated_time_in_seconds = 0.0
+    last_frame_time_in_milliseconds = performance.now()
+    drawn_shapes_with_transformations = list(simulation.shapes_with_world_transformations())
 
-        clear_canvas(canvas, canvas_ctx)
-        draw_component(canvas_ctx, simulation)
+    def update(frame_time_in_milliseconds: float) -> None:
+        nonlocal unsimulated_time_in_seconds, last_frame_time_in_milliseconds, drawn_shapes_with_transformations
+
+        unsimulated_time_in_seconds = min(
+            unsimulated_time_in_seconds + (frame_time_in_milliseconds - last_frame_time_in_milliseconds) / 1000,
+            max_unsimulated_time_in_seconds,
+        )
+        last_frame_time_in_milliseconds = frame_time_in_milliseconds
+
+        # Step the simulation at a fixed rate independently of the display's frame rate
+        simulation_changed = False
+        while unsimulated_time_in_seconds >= update_feq_in_seconds:
+            simulation.move_forward_in_time(update_feq_in_seconds)
+            unsimulated_time_in_seconds -= update_feq_in_seconds
+            simulation_changed = True
+
+        api.flush()
+
+        if simulation_changed:
+            shapes_with_transformations = list(simulation.shapes_with_world_transformations())
+
+            # Unchanged components hand back the same cached world transformations, so a robot standing still
+            # can be detected without comparing any matrices
+            if not all_identical(shapes_with_transformations, drawn_shapes_with_transformations):
+                clear_canvas(canvas_ctx, canvas_width, canvas_height)
+                draw_shapes(canvas_ctx, shapes_with_transformations)
+                drawn_shapes_with_transformations = shapes_with_transformations
+
+        requestAnimationFrame(update_sim_proxy)
+
+    clear_canvas(canvas_ctx, canvas_width, canvas_height)
+    draw_shapes(canvas_ctx, drawn_shapes_with_transformations)
 
     update_sim_proxy = create_proxy(update)
-    setInterval(update_sim_proxy, update_feq_in_seconds * 1000)
+    requestAnimationFrame(update_sim_proxy)
+
+
+def all_identical(
+        shapes_with_transformations: list[tuple[Shape, geometry.AffineTransformation]],
+        other_shapes_with_transformations: list[tuple[Shape, geometry.AffineTransformation]],
+) -> bool:
+    return len(shapes_with_transformations) == len(other_shapes_with_transformations) and all(
+        shape is other_shape and transformation is other_transformation
+        for (shape, transformation), (other_shape, other_transformation)
+        in zip(shapes_with_transformations, other_shapes_with_transformations)
+    )
+
+
+def draw_shapes(canvas_ctx, shapes_with_transformations: Iterable[tuple[Shape, geometry.AffineTransformation]]) -> None:
+    # Most shapes share a style, so only touch the canvas state when the style changes
+    current_style = None
+
+    for shape, transformation in shapes_with_transformations:
+        if shape.style != current_style:
+            set_style(canvas_ctx, shape.style)
+            current_style = shape.style
+
+        draw_shape(canvas_ctx, shape, transformation, style_is_set=True)
+
 
+def draw_shape(
+        canvas_ctx,
+        shape: Shape,
+        transformation: geometry.AffineTransformation | None = None,
+        *,
+        style_is_set: bool = False,
+) -> None:
+    path = shape_path(shape, transformation)
 
-def draw_component(canvas_ctx, component: Component) -> None:
-    for shape in component.shapes_in_world_coordinates():
-        draw_shape(canvas_ctx, shape)
+    if not style_is_set:
+        set_style(canvas_ctx, shape.style)
 
+    canvas_ctx.fill(path)
+    canvas_ctx.stroke(path)
 
-def draw_shape(canvas_ctx, shape: Shape) -> None:
-    canvas_ctx.beginPath()
 
-    canvas_ctx.moveTo(shape.vertices[0].x, shape.vertices[0].y)
-    for vertex in shape.vertices[1:]:
-        canvas_ctx.lineTo(vertex.x, vertex.y)
-    canvas_ctx.closePath()
+def set_style(canvas_ctx, style: Style) -> None:
+    if style.stroke_color is not None:
+        canvas_ctx.strokeStyle = style.stroke_color
+    if style.fill_color is not None:
+        canvas_ctx.fillStyle = style.fill_color
 
-    if shape.style.stroke_color is not None:
-        canvas_ctx.strokeStyle = shape.style.stroke_color
-    if shape.style.fill_color is not None:
-        canvas_ctx.fillStyle = shape.style.fill_color
 
-    canvas_ctx.fill()
-    canvas_ctx.stroke()
+def shape_path(shape: Shape, transformation: geometry.AffineTransformation | None = None):
+    # Shapes are drawn in their local coordinates, which rarely change, so their Path2D is kept on the shape
+    # until its vertices change. The transformed path is kept as well, for as long as the transformation is
+    # the same object, which is the case for every shape that didn't move since the last frame
+    version, path, cached_transformation, transformed_path = shape.render_cache or (None, None, None, None)
 
+    if version != shape.version:
+        # Hand the whole outline to the canvas in one call instead of one call per vertex
+        path = Path2D.new(svg_path_data(shape))
+        cached_transformation = transformed_path = None
 
-def clear_canvas(canvas, canvas_ctx) -> None:
-    canvas_ctx.clearRect(0, 0, canvas.width, canvas.height)
+    if transformation is None:
+        transformed_path = None
+    elif transformation is not cached_transformation:
+        # Transform the path itself rather than the context so that line widths stay in pixels
+        transformed_path = Path2D.new()
+        transformed_path.addPath(path, DOMMatrix.new(to_js(transformation.as_coefficients())))
+
+    shape.render_cache = (shape.version, path, transformation, transformed_path)
+
+    return path if transformed_path is None else transformed_path
+
+
+def svg_path_data(shape: Shape) -> str:
+    return "M " + " L ".join([f"{vertex.x} {vertex.y}" for vertex in shape.iter_vertices()]) + " Z"
+
+
+def clear_canvas(canvas_ctx, width: float, height: float) -> None:
+    canvas_ctx.clearRect(0, 0, width, height)
 
 
 class KeyboardInputHandler:
 
     def __init__(self):
-        self.on_key_down_callbacks: list[Callable[[str], None]] = []
-        self.on_key_up_callbacks: list[Callable[[str], None]] = []
+        self.on_key_down_callbacks = KeyCallbacks()
+        self.on_key_up_callbacks = KeyCallbacks()
+
+        # Keep the proxies so that they can be removed and released again in destroy
+        self._handle_key_down_proxy = create_proxy(self.handle_key_down)
+        self._handle_key_up_proxy = create_proxy(self.handle_key_up)
+
+        document.addEventListener("keydown", self._handle_key_down_proxy)
+        document.addEventListener("keyup", self._handle_key_up_proxy)
 
-        document.addEventListener("keydown", create_proxy(self.handle_key_down))
-        document.addEventListener("keyup", create_proxy(self.handle_key_up))
+    def destroy(self) -> None:
+        document.removeEventListener("keydown", self._handle_key_down_proxy)
+        document.removeEventListener("keyup", self._handle_key_up_proxy)
+
+        self._handle_key_down_proxy.destroy()
+        self._handle_key_up_proxy.destroy()
 
     def on_forward_key_down(self, callback: Callable[[str], None] | Callable[[], None]) -> KeyboardInputHandler:
         return self.on_key_down(callback, "w", "ArrowUp", ignore_case=True)
@@ -183,56 +280,74 @@ class KeyboardInputHandler:
         )
 
     def handle_key_down(self, event) -> None:
-        for callback in self.on_key_down_callbacks:
-            callback(event.key)
+        self.on_key_down_callbacks.dispatch(event.key)
 
     def handle_key_up(self, event) -> None:
-        for callback in self.on_key_up_callbacks:
-            callback(event.key)
+        self.on_key_up_callbacks.dispatch(event.key)
 
     def add_key_callback_to_list(
             self,
-            callbacks: list[Callable[[str], None]],
+            callbacks: KeyCallbacks,
             callback: Callable[[str], None] | Callable[[], None],
             *expected_keys: str,
             ignore_case: bool = False
     ) -> KeyboardInputHandler:
+        # Decide once whether the callback takes the key instead of retrying it on every event
+        if _takes_key_arg(callback):
+            key_callback = cast(Callable[[str], None], callback)
+        else:
 
-        def try_callback_with_and_without_key_arg(key: str) -> None:
-            try:
-                return callback(key)
-            except TypeError as err:
-                if "arguments" in str(err):
-                    return callback()
+            def key_callback(_key: str) -> None:
+                callback()
 
-                raise err
+        callbacks.add(key_callback, *expected_keys, ignore_case=ignore_case)
 
-        if expected_keys:
+        return self
 
-            if ignore_case:
-                expected_keys_set = {key.lower() for key in expected_keys}
-            else:
-                expected_keys_set = set(expected_keys)
 
-            def real_callback(key: str) -> None:
+def _takes_key_arg(callback: Callable[[str], None] | Callable[[], None]) -> bool:
+    try:
+        return bool(inspect.signature(callback).parameters)
+    except ValueError:
+        # Some builtins don't expose a signature, assume they accept the key
+        return True
 
-                if ignore_case:
-                    key = key.lower()
 
-                if key in expected_keys_set:
-                    try_callback_with_and_without_key_arg(key)
+class KeyCallbacks:
 
+    def __init__(self) -> None:
+        # Callbacks are bucketed by the key they expect so that dispatching a key event is a dict lookup
+        self._for_any_key: list[Callable[[str], None]] = []
+        self._by_key: dict[str, list[Callable[[str], None]]] = {}
+        self._by_lowercase_key: dict[str, list[Callable[[str], None]]] = {}
+
+    def add(self, callback: Callable[[str], None], *expected_keys: str, ignore_case: bool = False) -> KeyCallbacks:
+        if not expected_keys:
+            self._for_any_key.append(callback)
+        elif ignore_case:
+            for key in {key.lower() for key in expected_keys}:
+                self._by_lowercase_key.setdefault(key, []).append(callback)
         else:
+            for key in set(expected_keys):
+                self._by_key.setdefault(key, []).append(callback)
 
-            def real_callback(key: str) -> None:
-                try_callback_with_and_without_key_arg(key)
+        return self
 
-        callbacks.append(real_callback)
+    def dispatch(self, key: str) -> None:
+        for callback in self._for_any_key:
+            callback(key)
 
-        return self
+        for callback in self._by_key.get(key, ()):
+            callback(key)
+
+        if self._by_lowercase_key:
+            lowercase_key = key.lower()
+
+            for callback in self._by_lowercase_key.get(lowercase_key, ()):
+                callback(lowercase_key)
 
 
-@dataclass
+@dataclass(slots=True)
 class Request:
     route: str
     method: str = "GET"
@@ -242,35 +357,55 @@ class Request:
 
 class APILayer:
     API_BASE_URL = "http://0.0.0.0:8000/api"
+    # Shared by every request, pyfetch only reads it
+    _JSON_HEADERS = {"Content-Type": "application/json"}
 
     def __init__(self) -> None:
-        self._async_tasks: deque[asyncio.Task] = deque()
+        self._async_tasks: set[asyncio.Task] = set()
+        self._pending_steering_angle: float | None = None
+        self._pending_speed: float | None = None
+        self._last_steering_angle: float | None = None
+        self._last_speed: float | None = None
 
     def put_steering_angle(self, heading: float) -> None:
-        self._create_request_task(Request(
-            route="/set_steering_angle",
-            method="PUT",
-            body=r'{"value": ' + str(heading) + r'}',
-            headers={"Content-Type": "application/json"}
-        ))
+        # Sent on the next flush, so that several key events in one frame result in a single request
+        self._pending_steering_angle = heading
 
     def put_speed(self, speed: float) -> None:
-        self._create_request_task(Request(
-            route="/set_speed",
-            method="PUT",
-            body=r'{"value": ' + str(speed) + r'}',
-            headers={"Content-Type": "application/json"}
-        ))
+        self._pending_speed = speed
+
+    def flush(self) -> None:
+        # Key repeats and releases often leave the value the API already has
+        if self._pending_steering_angle is not None and self._pending_steering_angle != self._last_steering_angle:
+            self._last_steering_angle = self._pending_steering_angle
+            self._create_request_task(Request(
+                route="/set_steering_angle",
+                method="PUT",
+                body=json.dumps({"value": self._pending_steering_angle}),
+                headers=self._JSON_HEADERS
+            ))
+
+        if self._pending_speed is not None and self._pending_speed != self._last_speed:
+            self._last_speed = self._pending_speed
+            self._create_request_task(Request(
+                route="/set_speed",
+                method="PUT",
+                body=json.dumps({"value": self._pending_speed}),
+                headers=self._JSON_HEADERS
+            ))
 
     def wait_for_requests_to_finish(self) -> None:
         loop = asyncio.get_event_loop()
 
+        # Let the requests run concurrently instead of waiting for them one after another
         while self._async_tasks:
-            task = self._async_tasks.popleft()
-            loop.run_until_complete(task)
+            loop.run_until_complete(asyncio.gather(*self._async_tasks))
 
     def _create_request_task(self, request: Request) -> None:
-        self._async_tasks.append(asyncio.create_task(self._make_request(request)))
+        # The event loop only keeps weak references to tasks, so hold on to each until it has finished
+        task = asyncio.create_task(self._make_request(request))
+        self._async_tasks.add(task)
+        task.add_done_callback(self._async_tasks.discard)
 
     async def _make_request(self, request: Request, **fetch_kwargs: Any) -> FetchResponse:
         kwargs = {"method": request.method, "mode": "cors"}